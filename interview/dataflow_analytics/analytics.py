@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-import json
+import re
+import threading
 from dataclasses import dataclass
-from datetime import date
-from typing import Any
+from typing import Any, Iterable
+
+import orjson
 
 from .config import Settings, settings as default_settings
 from .storage import S3Storage
 
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 
 @dataclass
 class MetricsSummary:
@@ -22,48 +26,85 @@ class AnalyticsService:
         self.cfg = cfg or default_settings
         self.storage = S3Storage(self.cfg.s3_bucket, self.cfg.s3_prefix, self.cfg)
         self.metrics_key = self.storage.key("metrics_by_day.jsonl")
+        self._cache: tuple[str, list[dict[str, Any]], MetricsSummary] | None = None
+        self._lock = threading.Lock()
 
-    def load_metrics(self) -> list[dict[str, Any]]:
+    def _load(self) -> tuple[list[dict[str, Any]], MetricsSummary]:
+        # Like the old uncached path, any storage failure degrades to empty metrics.
         try:
-            text = self.storage.download_text(self.metrics_key)
+            etag = self.storage.etag(self.metrics_key)
         except Exception:
-            return []
-        rows = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            rows.append(json.loads(line))
-        return rows
+            return [], _summarize([])
+        if etag is None:
+            return [], _summarize([])
+        cache = self._cache
+        if cache is not None and cache[0] == etag:
+            return cache[1], cache[2]
+        # Endpoints run in FastAPI's threadpool; only one of them should refetch.
+        with self._lock:
+            cache = self._cache
+            try:
+                # The cached ETag comes from the GET itself, so a concurrent upload can't
+                # leave newer rows filed under an older ETag.
+                fetched = self.storage.iter_lines_if_changed(self.metrics_key, cache[0] if cache else None)
+                if fetched is not None:
+                    new_etag, lines = fetched
+                    rows = [orjson.loads(line) for line in lines if line.strip()]
+                    cache = self._cache = (new_etag, rows, _summarize(rows))
+            except Exception:
+                # Don't cache a failed read.
+                return [], _summarize([])
+        if cache is None:
+            return [], _summarize([])
+        return cache[1], cache[2]
+
+    def load_metrics(self) -> list[dict[str, Any]]:
+        """Return the parsed metrics rows.
+
+        The list and its dicts are shared with the cache; callers must not mutate them.
+        """
+        return self._load()[0]
 
     def summary(self) -> MetricsSummary:
-        rows = self.load_metrics()
-        total_events = 0
-        daily_unique_users_sum = 0
-        event_types: dict[str, int] = {}
-        dates: list[date] = []
-        for row in rows:
-            count = int(row.get("event_count", 0))
-            unique_users = int(row.get("unique_users", 0))
-            total_events += count
-            daily_unique_users_sum += unique_users
-            event_type = row.get("event_type") or "unknown"
-            event_types[event_type] = event_types.get(event_type, 0) + count
-            event_date = row.get("event_date")
-            if event_date:
-                try:
-                    dates.append(date.fromisoformat(event_date))
-                except ValueError:
-                    pass
-        date_range = None
-        if dates:
-            date_range = {
-                "start": min(dates).isoformat(),
-                "end": max(dates).isoformat(),
-            }
-        return MetricsSummary(
-            total_events=total_events,
-            event_types=event_types,
-            dates=date_range,
-            daily_unique_users_sum=daily_unique_users_sum,
-        )
+        """Return the metrics summary.
+
+        The instance is shared with the cache; callers must not mutate it.
+        """
+        return self._load()[1]
+
+
+def _summarize(rows: Iterable[dict[str, Any]]) -> MetricsSummary:
+    total_events = 0
+    daily_unique_users_sum = 0
+    event_types: dict[str, int] = {}
+    get_type_count = event_types.get
+    min_date: str | None = None
+    max_date: str | None = None
+    for row in rows:
+        # orjson already yields ints; only coerce the odd non-int value.
+        count = row.get("event_count", 0)
+        if type(count) is not int:
+            count = int(count)
+        unique_users = row.get("unique_users", 0)
+        if type(unique_users) is not int:
+            unique_users = int(unique_users)
+        total_events += count
+        daily_unique_users_sum += unique_users
+        event_type = row.get("event_type") or "unknown"
+        event_types[event_type] = get_type_count(event_type, 0) + count
+        # ISO dates order lexicographically, so a shape check stands in for parsing.
+        event_date = row.get("event_date")
+        if isinstance(event_date, str) and _ISO_DATE_RE.fullmatch(event_date):
+            if min_date is None or event_date < min_date:
+                min_date = event_date
+            if max_date is None or event_date > max_date:
+                max_date = event_date
+    date_range = None
+    if min_date is not None and max_date is not None:
+        date_range = {"start": min_date, "end": max_date}
+    return MetricsSummary(
+        total_events=total_events,
+        event_types=event_types,
+        dates=date_range,
+        daily_unique_users_sum=daily_unique_users_sum,
+    )
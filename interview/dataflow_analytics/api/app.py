@@ -5,7 +5,7 @@ from typing import Any
 
 from fastapi import Depends, FastAPI, Query
 from pydantic import BaseModel, Field
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from dataflow_analytics.analytics import AnalyticsService, MetricsSummary
 from dataflow_analytics.config import Settings, settings as default_settings
@@ -68,6 +68,7 @@ def create_app(cfg: Settings | None = None) -> FastAPI:
         ),
         contact={"name": "DataFlow Analytics"},
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         openapi_tags=[
             {"name": "health", "description": "Service health and readiness."},
             {"name": "analytics", "description": "Aggregated metrics endpoints."},
@@ -93,13 +94,15 @@ def create_app(cfg: Settings | None = None) -> FastAPI:
 
     @app.get(
         "/analytics/metrics",
-        response_model=AnalyticsMetricsResponse,
+        response_model=None,
+        responses={200: {"model": AnalyticsMetricsResponse}},
         tags=["analytics"],
         summary="Raw metrics",
         description="Returns the raw aggregated metrics loaded from S3.",
     )
-    def analytics_metrics(service: AnalyticsService = Depends(get_analytics)) -> AnalyticsMetricsResponse:
-        return AnalyticsMetricsResponse(metrics=service.load_metrics())
+    def analytics_metrics(service: AnalyticsService = Depends(get_analytics)) -> ORJSONResponse:
+        # Rows are already-parsed JSON; skip a per-row pydantic validation pass.
+        return ORJSONResponse({"metrics": service.load_metrics()})
 
     @app.get(
         "/analytics/summary",
@@ -140,11 +143,11 @@ def create_app(cfg: Settings | None = None) -> FastAPI:
         description="Lists all available operational document IDs.",
     )
     def docs_list(store: DocumentStore = Depends(get_docs)) -> DocumentsListResponse:
-        return DocumentsListResponse(documents=[doc_id for doc_id, _ in store._documents])
+        return DocumentsListResponse(documents=[doc_id for doc_id, _, _ in store._documents])
 
     @app.exception_handler(Exception)
     def handle_errors(_, exc: Exception):
-        return JSONResponse(status_code=500, content={"error": str(exc)})
+        return ORJSONResponse(status_code=500, content={"error": str(exc)})
 
     return app
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,6 +16,9 @@ class Settings(BaseSettings):
     s3_endpoint_url: str | None = None
     s3_use_mock: bool = True
 
+    # Transform job engine: "spark", or "duckdb" for fast local runs
+    transform_engine: Literal["spark", "duckdb"] = "spark"
+
     # Local paths
     base_dir: Path = Path(__file__).resolve().parents[1]
     data_dir: Path = base_dir / "dataflow_analytics" / "data"
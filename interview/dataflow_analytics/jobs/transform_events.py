@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import shutil
 from pathlib import Path
 
 from pyspark.sql import SparkSession
@@ -9,6 +10,8 @@ from pyspark.sql.functions import approx_count_distinct, col, count, to_date, to
 from dataflow_analytics.config import settings
 from dataflow_analytics.storage import S3Storage
 
+COPY_BUFFER_BYTES = 8 * 1024 * 1024
+
 
 def build_spark(app_name: str = "dataflow-transform") -> SparkSession:
     return (
@@ -38,23 +41,66 @@ def transform_events(spark: SparkSession, input_path: Path):
     return agg
 
 
+def transform_events_fast(input_path: Path, output_path: Path) -> Path:
+    """Aggregate events with DuckDB in-process, skipping the Spark/JVM startup."""
+    import duckdb
+
+    def literal(path: Path) -> str:
+        return "'" + str(path).replace("'", "''") + "'"
+
+    con = duckdb.connect()
+    try:
+        con.execute("SET TimeZone = 'UTC'")
+        con.execute(
+            f"""
+            COPY (
+                SELECT
+                    strftime(CAST("timestamp" AS TIMESTAMPTZ), '%Y-%m-%d') AS event_date,
+                    event_type,
+                    COUNT(*) AS event_count,
+                    approx_count_distinct(user_id) AS unique_users
+                FROM read_json_auto({literal(input_path)}, format = 'newline_delimited')
+                GROUP BY 1, 2
+                ORDER BY 1, 2
+            ) TO {literal(output_path)} (FORMAT JSON)
+            """
+        )
+    finally:
+        con.close()
+    return output_path
+
+
 def write_metrics_jsonl(agg_df, output_dir: Path) -> Path:
     metrics_dir = output_dir / "metrics_by_day"
-    agg_df.coalesce(1).write.mode("overwrite").json(str(metrics_dir))
-    part_files = list(metrics_dir.glob("part-*.json"))
+    agg_df.write.mode("overwrite").json(str(metrics_dir))
+    # Part files are numbered in partition order, which follows the orderBy.
+    part_files = sorted(metrics_dir.glob("part-*.json"))
     if not part_files:
         raise FileNotFoundError("Spark did not output any part files")
-    return part_files[0]
-
-
-def run_job(input_path: Path, output_dir: Path, storage: S3Storage) -> Path:
+    merged = metrics_dir / "metrics_by_day.jsonl"
+    with open(merged, "wb") as out:
+        for part_file in part_files:
+            with open(part_file, "rb") as f:
+                shutil.copyfileobj(f, out, length=COPY_BUFFER_BYTES)
+    return merged
+
+
+def run_job(input_path: Path, output_dir: Path, storage: S3Storage, engine: str | None = None) -> Path:
+    engine = engine or settings.transform_engine
+    if engine not in ("spark", "duckdb"):
+        raise ValueError(f"Unknown transform engine: {engine!r}")
+    if engine == "duckdb":
+        output_dir.mkdir(parents=True, exist_ok=True)
+        metrics_file = transform_events_fast(input_path, output_dir / "metrics_by_day.jsonl")
+        storage.upload_file(metrics_file, storage.key("metrics_by_day.jsonl"))
+        return metrics_file
     spark = build_spark()
     try:
         agg_df = transform_events(spark, input_path)
         output_dir.mkdir(parents=True, exist_ok=True)
-        part_file = write_metrics_jsonl(agg_df, output_dir)
-        storage.upload_file(part_file, storage.key("metrics_by_day.jsonl"))
-        return part_file
+        metrics_file = write_metrics_jsonl(agg_df, output_dir)
+        storage.upload_file(metrics_file, storage.key("metrics_by_day.jsonl"))
+        return metrics_file
     finally:
         spark.stop()
 
@@ -65,11 +111,12 @@ def main() -> None:
     parser.add_argument("--output-dir", type=Path, default=settings.tmp_dir / "spark-output")
     parser.add_argument("--bucket", type=str, default=settings.s3_bucket)
     parser.add_argument("--prefix", type=str, default=settings.s3_prefix)
+    parser.add_argument("--engine", choices=["spark", "duckdb"], default=settings.transform_engine)
     args = parser.parse_args()
 
     storage = S3Storage(bucket=args.bucket, prefix=args.prefix)
-    part_file = run_job(args.input, args.output_dir, storage)
-    print(f"Uploaded metrics from {part_file} to s3://{storage.bucket}/{storage.key('metrics_by_day.jsonl')}")
+    metrics_file = run_job(args.input, args.output_dir, storage, engine=args.engine)
+    print(f"Uploaded metrics from {metrics_file} to s3://{storage.bucket}/{storage.key('metrics_by_day.jsonl')}")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,58 @@
 from __future__ import annotations
 
+import functools
+import heapq
+import math
+import re
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+# Mirrors TfidfVectorizer's default token_pattern.
+_TOKEN_RE = re.compile(r"\b\w\w+\b")
+
+_STOP_WORDS = frozenset(
+    """
+    a about after all also am an and any are as at be been before being but by can could did do
+    does doing down during each few for from further had has have having he her here hers him his
+    how if in into is it its itself just me more most my no nor not now of off on once only or
+    other our ours out over own same she should so some such than that the their theirs them then
+    there these they this those through to too under until up very was we were what when where
+    which while who whom why will with would you your yours
+    """.split()
+)
+
+
+def _tokenize(lowered: str) -> list[str]:
+    return [token for token in _TOKEN_RE.findall(lowered) if token not in _STOP_WORDS]
+
+
+_Index = tuple[list[tuple[str, str, str]], list["Counter[str]"], dict[str, float], list[float]]
+
+
+@functools.lru_cache(maxsize=8)
+def _build_index(docs_dir: str, max_mtime: int) -> _Index:
+    """Build the TF-IDF index for a docs dir; cached until any file changes.
+
+    The returned structures are shared between stores and must not be mutated.
+    """
+    docs = []
+    for path in sorted(Path(docs_dir).glob("*.md")):
+        text = path.read_text(encoding="utf-8").strip()
+        docs.append((path.stem, text, text.lower()))
+    term_counts = [Counter(_tokenize(lowered)) for _, _, lowered in docs]
+    doc_freq: Counter[str] = Counter()
+    for counts in term_counts:
+        doc_freq.update(counts.keys())
+    # Smoothed IDF, same formula as TfidfVectorizer(smooth_idf=True).
+    n_docs = len(docs)
+    idf = {term: math.log((1 + n_docs) / (1 + df)) + 1.0 for term, df in doc_freq.items()}
+    norms = [
+        math.sqrt(sum((count * idf[term]) ** 2 for term, count in counts.items()))
+        for counts in term_counts
+    ]
+    return docs, term_counts, idf, norms
 
 
 @dataclass
@@ -19,39 +66,60 @@ class DocumentResult:
 class DocumentStore:
     def __init__(self, docs_dir: Path):
         self.docs_dir = docs_dir
-        self._documents: list[tuple[str, str]] = []
-        self._vectorizer: TfidfVectorizer | None = None
-        self._matrix = None
+        # (doc_id, text, lowered text) so snippets don't re-lowercase per query.
+        self._documents: list[tuple[str, str, str]] = []
+        self._term_counts: list[Counter[str]] = []
+        self._idf: dict[str, float] = {}
+        self._norms: list[float] = []
         self._load_documents()
+        # Hot queries repeat a lot; the cache is per store so it never outlives the index.
+        self._qv_cache = functools.lru_cache(maxsize=256)(self._transform_query)
 
     def _load_documents(self) -> None:
-        docs = []
-        for path in sorted(self.docs_dir.glob("*.md")):
-            text = path.read_text(encoding="utf-8").strip()
-            docs.append((path.stem, text))
-        self._documents = docs
-        if docs:
-            self._vectorizer = TfidfVectorizer(stop_words="english")
-            self._matrix = self._vectorizer.fit_transform([text for _, text in docs])
+        paths = sorted(self.docs_dir.glob("*.md"))
+        # The directory's own mtime changes when files are added or removed.
+        mtimes = [path.stat().st_mtime_ns for path in paths]
+        if self.docs_dir.is_dir():
+            mtimes.append(self.docs_dir.stat().st_mtime_ns)
+        index = _build_index(str(self.docs_dir), max(mtimes, default=0))
+        self._documents, self._term_counts, self._idf, self._norms = index
+
+    def _transform_query(self, query_lowered: str) -> tuple[tuple[str, float], ...]:
+        """Return (term, weight) pairs with the query's norm and the doc-side IDF folded in."""
+        idf = self._idf
+        query_weights = {
+            term: count * idf[term] for term, count in Counter(_tokenize(query_lowered)).items() if term in idf
+        }
+        query_norm = math.sqrt(sum(weight * weight for weight in query_weights.values()))
+        if not query_norm:
+            return ()
+        return tuple((term, weight * idf[term] / query_norm) for term, weight in query_weights.items())
 
     def search(self, query: str, top_k: int = 3) -> list[DocumentResult]:
-        if not self._documents or not self._vectorizer or self._matrix is None:
+        if not self._documents:
             return []
-        query_vec = self._vectorizer.transform([query])
-        scores = cosine_similarity(query_vec, self._matrix).flatten()
-        ranked = sorted(enumerate(scores), key=lambda item: item[1], reverse=True)
+        query_lowered = query.lower()
+        query_terms = self._qv_cache(query_lowered.strip())
+        scores: list[float] = []
+        for counts, norm in zip(self._term_counts, self._norms):
+            if not query_terms or not norm:
+                scores.append(0.0)
+                continue
+            # Only the query's terms can contribute to the dot product.
+            dot = sum(counts[term] * weight for term, weight in query_terms)
+            scores.append(dot / norm)
+        top = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
         results: list[DocumentResult] = []
-        for idx, score in ranked[:top_k]:
-            doc_id, text = self._documents[idx]
-            snippet = _snippet(text, query)
+        for idx in top:
+            score = scores[idx]
+            doc_id, text, lowered = self._documents[idx]
+            snippet = _snippet(text, lowered, query_lowered)
             results.append(DocumentResult(doc_id=doc_id, title=doc_id.replace("_", " ").title(), score=float(score), snippet=snippet))
         return results
 
 
-def _snippet(text: str, query: str, window: int = 160) -> str:
-    lowered = text.lower()
-    q = query.lower()
-    pos = lowered.find(q)
+def _snippet(text: str, lowered: str, query_lowered: str, window: int = 160) -> str:
+    pos = lowered.find(query_lowered)
     if pos == -1:
         return text[:window].strip()
     start = max(pos - window // 4, 0)
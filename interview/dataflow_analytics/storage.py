@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from .config import Settings, settings as default_settings
 
 _MOTO_CONTEXT = None
 
+# Below boto3's default multipart threshold, a plain PutObject is cheaper.
+SMALL_UPLOAD_MAX_BYTES = 8 * 1024 * 1024
+
+# Large reads cut the number of HTTP chunk round trips on big objects.
+READ_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Thread pools share one client, so its connection pool must fit every worker
+# (botocore defaults to 10, which makes urllib3 drop and reopen connections).
+MAX_POOL_CONNECTIONS = 16
+
 
 def start_moto() -> None:
     """Start moto's in-memory S3 mock for local development."""
@@ -30,17 +43,48 @@ def stop_moto() -> None:
     if _MOTO_CONTEXT is not None:
         _MOTO_CONTEXT.stop()
         _MOTO_CONTEXT = None
+        # Clients built under the mock must not outlive it.
+        _cached_client.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_client(region: str, endpoint_url: str | None, use_mock: bool):
+    # boto3 clients are thread-safe, so one per endpoint keeps its connection pool warm.
+    # use_mock is part of the key so mocked and real clients never mix.
+    return boto3.client(
+        "s3",
+        region_name=region,
+        endpoint_url=endpoint_url,
+        config=Config(max_pool_connections=MAX_POOL_CONNECTIONS),
+    )
 
 
 def get_s3_client(cfg: Settings | None = None):
     cfg = cfg or default_settings
     if cfg.s3_use_mock:
         start_moto()
-    return boto3.client(
-        "s3",
-        region_name=cfg.s3_region,
-        endpoint_url=cfg.s3_endpoint_url,
-    )
+    return _cached_client(cfg.s3_region, cfg.s3_endpoint_url, cfg.s3_use_mock)
+
+
+def _read_chunks(body, chunk_size: int) -> Iterator[bytes]:
+    try:
+        while True:
+            chunk = body.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        body.close()
+
+
+def _split_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
 
 
 class S3Storage:
@@ -49,8 +93,11 @@ class S3Storage:
         self.client = get_s3_client(self.cfg)
         self.bucket = bucket
         self.prefix = (prefix or "").strip("/")
+        self._bucket_ensured = False
 
     def ensure_bucket(self) -> None:
+        if self._bucket_ensured:
+            return
         try:
             self.client.head_bucket(Bucket=self.bucket)
         except ClientError:
@@ -58,6 +105,7 @@ class S3Storage:
             if self.cfg.s3_region != "us-east-1":
                 params["CreateBucketConfiguration"] = {"LocationConstraint": self.cfg.s3_region} # type: ignore
             self.client.create_bucket(**params)
+        self._bucket_ensured = True
 
     def key(self, name: str) -> str:
         if self.prefix:
@@ -65,36 +113,102 @@ class S3Storage:
         return name
 
     def upload_file(self, local_path: Path, key: str) -> None:
+        if os.path.getsize(local_path) < SMALL_UPLOAD_MAX_BYTES:
+            self.upload_file_small(local_path, key)
+            return
         self.ensure_bucket()
         self.client.upload_file(str(local_path), self.bucket, key)
 
-    def upload_text(self, text: str, key: str) -> None:
+    def upload_file_small(self, local_path: Path, key: str) -> None:
+        # A single PutObject skips the TransferManager's multipart setup.
+        self.ensure_bucket()
+        with open(local_path, "rb") as f:
+            self.client.put_object(Bucket=self.bucket, Key=key, Body=f)
+
+    def upload_text(self, text: str | bytes | bytearray, key: str) -> None:
         self.ensure_bucket()
-        self.client.put_object(Bucket=self.bucket, Key=key, Body=text.encode("utf-8"))
+        # botocore takes bytes/bytearray blobs as-is; only str needs encoding.
+        data = text if isinstance(text, (bytes, bytearray)) else text.encode("utf-8")
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=data)
+
+    def etag(self, key: str) -> str | None:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)["ETag"]
+        except ClientError:
+            return None
+
+    def iter_bytes(self, key: str, chunk_size: int = READ_CHUNK_BYTES) -> Iterator[bytes]:
+        body = self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+        return _read_chunks(body, chunk_size)
+
+    def iter_lines(self, key: str, chunk_size: int = READ_CHUNK_BYTES) -> Iterator[bytes]:
+        return _split_lines(self.iter_bytes(key, chunk_size))
+
+    def iter_lines_if_changed(
+        self, key: str, etag: str | None, chunk_size: int = READ_CHUNK_BYTES
+    ) -> tuple[str, Iterator[bytes]] | None:
+        """GET `key` unless its ETag still equals `etag`; returns the served ETag and its lines."""
+        params = {"Bucket": self.bucket, "Key": key}
+        if etag:
+            params["IfNoneMatch"] = etag
+        try:
+            obj = self.client.get_object(**params)
+        except ClientError as exc:
+            if exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 304:
+                return None
+            if exc.response.get("Error", {}).get("Code") in ("304", "NotModified"):
+                return None
+            raise
+        return obj["ETag"], _split_lines(_read_chunks(obj["Body"], chunk_size))
 
     def download_text(self, key: str) -> str:
-        obj = self.client.get_object(Bucket=self.bucket, Key=key)
-        return obj["Body"].read().decode("utf-8")
+        data = bytearray()
+        for chunk in self.iter_bytes(key):
+            data += chunk
+        return data.decode("utf-8")
 
-    def list_objects(self, prefix: str | None = None) -> list[str]:
+    def list_objects(self, prefix: str | None = None) -> Iterator[str]:
+        # Ensure the bucket now rather than on the first next() of the generator.
         self.ensure_bucket()
         params = {"Bucket": self.bucket}
         if prefix:
             params["Prefix"] = prefix
-        resp = self.client.list_objects_v2(**params)
-        return [item["Key"] for item in resp.get("Contents", [])]
+        return self._iter_keys(params)
+
+    def _iter_keys(self, params: dict) -> Iterator[str]:
+        for page in self.client.get_paginator("list_objects_v2").paginate(**params):
+            for item in page.get("Contents", []):
+                yield item["Key"]
 
-    def upload_directory(self, local_dir: Path, key_prefix: str) -> list[str]:
-        uploaded = []
+    def download_many(self, keys: Iterable[str], max_workers: int = MAX_POOL_CONNECTIONS) -> dict[str, bytes]:
+        def fetch(key: str) -> bytes:
+            return self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+        keys = list(keys)
+        with ThreadPoolExecutor(max_workers=min(max_workers, MAX_POOL_CONNECTIONS)) as pool:
+            return dict(zip(keys, pool.map(fetch, keys)))
+
+    def upload_directory(
+        self, local_dir: Path, key_prefix: str, max_workers: int = MAX_POOL_CONNECTIONS
+    ) -> list[str]:
+        pairs: list[tuple[Path, str]] = []
         for root, _, files in os.walk(local_dir):
             for name in files:
                 path = Path(root) / name
                 rel = path.relative_to(local_dir)
-                key = f"{key_prefix}/{rel.as_posix()}"
-                self.upload_file(path, key)
-                uploaded.append(key)
-        return uploaded
+                pairs.append((path, f"{key_prefix}/{rel.as_posix()}"))
+        if not pairs:
+            return []
+        self.ensure_bucket()
+        # boto3 clients are thread-safe; overlap the per-object round trips.
+        with ThreadPoolExecutor(max_workers=min(max_workers, MAX_POOL_CONNECTIONS)) as pool:
+            list(pool.map(lambda pair: self.upload_file(*pair), pairs))
+        return [key for _, key in pairs]
 
     def upload_jsonl(self, rows: Iterable[dict], key: str) -> None:
-        payload = "\n".join(json.dumps(row, sort_keys=True) for row in rows)
+        payload = bytearray()
+        for i, row in enumerate(rows):
+            if i:
+                payload += b"\n"
+            payload += orjson.dumps(row, option=orjson.OPT_SORT_KEYS)
         self.upload_text(payload, key)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import orjson
+
+from dataflow_analytics.analytics import AnalyticsService, _summarize
+from dataflow_analytics.config import Settings
+from dataflow_analytics.storage import start_moto, stop_moto
+
+
+def _jsonl(rows: list[dict]) -> bytes:
+    return b"\n".join(orjson.dumps(row) for row in rows)
+
+
+def test_metrics_cache_refreshes_when_object_changes() -> None:
+    start_moto()
+    try:
+        cfg = Settings(s3_use_mock=True, s3_bucket="analytics-bucket", s3_prefix="metrics")
+        service = AnalyticsService(cfg)
+        assert service.load_metrics() == []
+        assert service.summary().total_events == 0
+
+        rows = [
+            {"event_date": "2026-01-30", "event_type": "page_view", "event_count": 5, "unique_users": 3},
+            {"event_date": "2026-01-31", "event_type": "purchase", "event_count": 2, "unique_users": 2},
+        ]
+        service.storage.upload_text(_jsonl(rows[:1]), service.metrics_key)
+        first = service.load_metrics()
+        assert service.load_metrics() is first
+        assert service.summary().total_events == 5
+
+        service.storage.upload_text(_jsonl(rows), service.metrics_key)
+        summary = service.summary()
+        assert summary.total_events == 7
+        assert summary.dates == {"start": "2026-01-30", "end": "2026-01-31"}
+        assert len(service.load_metrics()) == 2
+    finally:
+        stop_moto()
+
+
+def test_summary_ignores_malformed_event_dates() -> None:
+    summary = _summarize(
+        [
+            {"event_date": "2026-01-02", "event_type": "page_view", "event_count": 1, "unique_users": 1},
+            {"event_date": "bad", "event_type": "page_view", "event_count": 1, "unique_users": 1},
+            {"event_date": 20260105, "event_type": "page_view", "event_count": 1, "unique_users": 1},
+            {"event_date": "2026-01-01", "event_type": "purchase", "event_count": 2, "unique_users": 1},
+        ]
+    )
+    assert summary.dates == {"start": "2026-01-01", "end": "2026-01-02"}
+    assert summary.total_events == 5
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import orjson
 from fastapi.testclient import TestClient
 
 from dataflow_analytics.api.app import create_app
@@ -36,7 +36,7 @@ def test_api_summary_and_search(tmp_path: Path) -> None:
             {"event_date": "2026-01-30", "event_type": "page_view", "event_count": 5, "unique_users": 3},
             {"event_date": "2026-01-30", "event_type": "purchase", "event_count": 2, "unique_users": 2},
         ]
-        payload = "\n".join(json.dumps(row) for row in rows)
+        payload = b"\n".join(orjson.dumps(row) for row in rows)
         storage.upload_text(payload, storage.key("metrics_by_day.jsonl"))
 
         app = create_app(cfg)
@@ -45,6 +45,9 @@ def test_api_summary_and_search(tmp_path: Path) -> None:
             assert summary["total_events"] == 7
             assert summary["event_types"]["page_view"] == 5
 
+            metrics = client.get("/analytics/metrics").json()
+            assert metrics["metrics"] == rows
+
             results = client.get("/docs/search", params={"q": "latency"}).json()
             assert results["results"]
     finally:
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from dataflow_analytics.rag import DocumentStore
+
+
+def test_search_ranks_matching_document_first(tmp_path: Path) -> None:
+    (tmp_path / "ops.md").write_text(
+        "Ingestion latency should stay under 15 minutes. Check the Spark logs if latency grows.",
+        encoding="utf-8",
+    )
+    (tmp_path / "support.md").write_text(
+        "If purchase events drop, re-run the aggregation job.",
+        encoding="utf-8",
+    )
+    store = DocumentStore(tmp_path)
+
+    results = store.search("latency", top_k=2)
+    assert [result.doc_id for result in results] == ["ops", "support"]
+    assert 0.0 < results[0].score <= 1.0
+    assert results[1].score == 0.0
+    assert "latency" in results[0].snippet.lower()
+
+    assert [result.doc_id for result in store.search("purchase events", top_k=1)] == ["support"]
+
+
+def test_search_without_documents_returns_nothing(tmp_path: Path) -> None:
+    assert DocumentStore(tmp_path).search("latency") == []
+
+
+def test_index_is_reused_until_documents_change(tmp_path: Path) -> None:
+    doc = tmp_path / "ops.md"
+    doc.write_text("Spark logs live in the driver.", encoding="utf-8")
+    first = DocumentStore(tmp_path)
+    assert DocumentStore(tmp_path)._idf is first._idf
+
+    doc.write_text("Latency alerts page the on-call engineer.", encoding="utf-8")
+    stat = doc.stat()
+    os.utime(doc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    refreshed = DocumentStore(tmp_path)
+    assert refreshed._idf is not first._idf
+    assert refreshed.search("latency")[0].score > 0.0
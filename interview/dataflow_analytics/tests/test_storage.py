@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from dataflow_analytics.config import Settings
+from dataflow_analytics.storage import S3Storage, start_moto, stop_moto
+
+
+def test_upload_directory_then_list_and_download_many(tmp_path: Path) -> None:
+    start_moto()
+    try:
+        cfg = Settings(s3_use_mock=True, s3_bucket="storage-bucket", s3_prefix="docs")
+        storage = S3Storage(bucket=cfg.s3_bucket, prefix=cfg.s3_prefix, cfg=cfg)
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "a.md").write_text("alpha", encoding="utf-8")
+        (tmp_path / "nested" / "b.md").write_text("beta", encoding="utf-8")
+
+        uploaded = storage.upload_directory(tmp_path, storage.key("raw"))
+        storage.upload_jsonl([{"b": 2, "a": 1}, {"c": 3}], storage.key("rows.jsonl"))
+
+        assert sorted(storage.list_objects(storage.key("raw/"))) == sorted(uploaded)
+        assert storage.download_many(uploaded) == {
+            "docs/raw/a.md": b"alpha",
+            "docs/raw/nested/b.md": b"beta",
+        }
+        assert storage.download_text(storage.key("rows.jsonl")) == '{"a":1,"b":2}\n{"c":3}'
+    finally:
+        stop_moto()
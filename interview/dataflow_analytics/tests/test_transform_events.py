@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import orjson
+import pytest
+
 from dataflow_analytics.config import Settings
 from dataflow_analytics.jobs.transform_events import run_job
 from dataflow_analytics.storage import S3Storage, start_moto, stop_moto
@@ -15,7 +17,7 @@ def _write_events(path: Path) -> None:
         {"event_id": "3", "user_id": "u1", "event_type": "signup", "timestamp": "2026-01-30T11:00:00Z"},
         {"event_id": "4", "user_id": "u3", "event_type": "purchase", "timestamp": "2026-01-31T12:00:00Z"},
     ]
-    path.write_text("\n".join(json.dumps(row) for row in rows), encoding="utf-8")
+    path.write_bytes(b"\n".join(orjson.dumps(row) for row in rows))
 
 
 def test_run_job_uploads_metrics(tmp_path: Path) -> None:
@@ -31,7 +33,7 @@ def test_run_job_uploads_metrics(tmp_path: Path) -> None:
 
         key = storage.key("metrics_by_day.jsonl")
         text = storage.download_text(key)
-        rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+        rows = [orjson.loads(line) for line in text.splitlines() if line.strip()]
         assert len(rows) == 3
         counts = {(row["event_date"], row["event_type"]): row["event_count"] for row in rows}
         assert counts[("2026-01-30", "page_view")] == 2
@@ -39,3 +41,37 @@ def test_run_job_uploads_metrics(tmp_path: Path) -> None:
         assert counts[("2026-01-31", "purchase")] == 1
     finally:
         stop_moto()
+
+
+def test_run_job_duckdb_engine_uploads_metrics(tmp_path: Path) -> None:
+    pytest.importorskip("duckdb")
+    start_moto()
+    try:
+        raw_path = tmp_path / "events.jsonl"
+        _write_events(raw_path)
+        cfg = Settings(s3_use_mock=True, s3_bucket="test-bucket", s3_prefix="metrics")
+        storage = S3Storage(bucket=cfg.s3_bucket, prefix=cfg.s3_prefix, cfg=cfg)
+
+        run_job(raw_path, tmp_path / "duckdb", storage, engine="duckdb")
+
+        text = storage.download_text(storage.key("metrics_by_day.jsonl"))
+        rows = [orjson.loads(line) for line in text.splitlines() if line.strip()]
+        assert [(row["event_date"], row["event_type"], row["event_count"]) for row in rows] == [
+            ("2026-01-30", "page_view", 2),
+            ("2026-01-30", "signup", 1),
+            ("2026-01-31", "purchase", 1),
+        ]
+        assert rows[0]["unique_users"] == 2
+    finally:
+        stop_moto()
+
+
+def test_run_job_rejects_unknown_engine(tmp_path: Path) -> None:
+    start_moto()
+    try:
+        cfg = Settings(s3_use_mock=True, s3_bucket="test-bucket", s3_prefix="metrics")
+        storage = S3Storage(bucket=cfg.s3_bucket, prefix=cfg.s3_prefix, cfg=cfg)
+        with pytest.raises(ValueError, match="polars"):
+            run_job(tmp_path / "events.jsonl", tmp_path / "out", storage, engine="polars")
+    finally:
+        stop_moto()